@@ -1,4 +1,5 @@
 import asyncio
+import fcntl
 import logging
 import os
 import sys
@@ -10,9 +11,32 @@ from dotenv import load_dotenv
 from evdev import list_devices as list_evdev, InputDevice
 
 from onetouchcopy.service import Udisks2Manager, Service
-from onetouchcopy.utils import await_sig, LogLevels, EnvVars
+from onetouchcopy.utils import await_sig, LogLevels, EnvVars, Led
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 KERNEL_MODULE_NAME = "qnap8528"
+# From linux/input.h: EVIOCGNAME(256)
+EVIOCGNAME = 0x81004506
+
+
+def _evdev_name(path: str) -> str | None:
+    # Only read the device name instead of letting InputDevice probe all its capabilities
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return None
+    try:
+        buf = bytearray(256)
+        fcntl.ioctl(fd, EVIOCGNAME, buf)
+        return buf.split(b"\x00", 1)[0].decode(errors="replace")
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
 
 
 async def start():
@@ -63,16 +87,13 @@ async def start():
     logging.basicConfig(**logger_config)
     logger = logging.getLogger("One touch copy daemon")
 
-    if not os.path.exists(args.config):
-        logger.warning(f"Config {args.config} file not found")
-    else:
-        load_dotenv(args.config)
+    # load_dotenv() doesn't raise on missing files and returns False when nothing was loaded
+    if not load_dotenv(args.config):
+        logger.warning(f"Config {args.config} file not found or empty")
 
     try:
-        device = next(
-            device
-            for path in list_evdev()
-            if (device := InputDevice(path)).name == KERNEL_MODULE_NAME
+        device = InputDevice(
+            next(path for path in list_evdev() if _evdev_name(path) == KERNEL_MODULE_NAME)
         )
     except StopIteration:
         logger.critical(f"Firmware {KERNEL_MODULE_NAME} couldn't be found on the device")
@@ -89,12 +110,14 @@ async def start():
 
     path = Path(destination)
     try:
-        path.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(path.mkdir, parents=True, exist_ok=True)
     except OSError:
         logger.critical(f"Destination directory {path} is not writable")
         return 1
 
-    async with Udisks2Manager() as manager, Service(device, manager, path):
+    # The USB LED is shared between drive detection and copy status
+    led = Led("usb", logger)
+    async with Udisks2Manager(led) as manager, Service(device, manager, path, led):
         await await_sig()
 
     logger.log(LogLevels.SERVICE_LIFECYCLE, "Service stopped")
@@ -103,7 +126,9 @@ async def start():
 
 
 def main():
-    raise SystemExit(asyncio.get_event_loop().run_until_complete(start()))
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        raise SystemExit(runner.run(start()))
 
 
 if __name__ == "__main__":
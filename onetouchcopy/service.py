@@ -1,7 +1,11 @@
 import asyncio
-import re
-import shlex
-from contextlib import AbstractAsyncContextManager
+import errno
+import grp
+import os
+import pwd
+import secrets
+import threading
+from contextlib import AbstractAsyncContextManager, suppress
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +14,7 @@ from sdbus import DbusObjectManagerInterfaceAsync, sd_bus_open_system
 from sdbus.dbus_proxy_async_interface_base import DbusInterfaceBaseAsync
 
 from onetouchcopy.udisks2_interfaces import (
+    cstr,
     Filesystem,
     PartitionBlock,
     DeviceBusyError,
@@ -18,14 +23,23 @@ from onetouchcopy.utils import (
     parse_get_managed_objects,
     parse_interfaces_added,
     parse_interfaces_removed,
+    PARTITION_TABLE_IFACE,
     LogLevels,
     Led,
     logger,
-    LoggingLock,
+    make_lock,
     EnvVars,
 )
 
 WELL_KNOWN_DEV = "/dev/qnap-one-touch-copy"
+# UDisks2 sends symlinks as NUL-terminated byte arrays
+_WELL_KNOWN_DEV_BYTES = WELL_KNOWN_DEV.encode() + b"\x00"
+_WELL_KNOWN_DEV_BYTES_NO_NUL = _WELL_KNOWN_DEV_BYTES[:-1]
+COPY_CHUNK_SIZE = 1 << 20
+# Room left for the original name in a ".name.XXXXXX" temporary file under Linux's NAME_MAX
+_TMP_NAME_MAX = 255 - len("..XXXXXX")
+COPY_WORKERS = 1
+LISTENERS_STOP_TIMEOUT = 2.0
 
 DRIVE_IFACE = "org.freedesktop.UDisks2.Drive"
 FILESYSTEM_IFACE = "org.freedesktop.UDisks2.Filesystem"
@@ -39,9 +53,7 @@ class Udisks2Manager(AbstractAsyncContextManager):
             if not self._found_drive:
                 return None
             partitions = await self._found_drive.partitions
-            return [
-                Filesystem.new_proxy("org.freedesktop.UDisks2", it, self._bus) for it in partitions
-            ]
+            return [self._filesystem_proxy(it) for it in partitions]
 
     @property
     def _found_drive(self) -> PartitionBlock | None:
@@ -55,32 +67,38 @@ class Udisks2Manager(AbstractAsyncContextManager):
         else:
             self._led.off()
             self._filesystems.clear()
+            self._proxy_cache.clear()
 
-    def __init__(self):
+    def __init__(self, led: Led):
         self._bus = sd_bus_open_system()
         self._object_manager = DbusObjectManagerInterfaceAsync.new_proxy(
             "org.freedesktop.UDisks2", "/org/freedesktop/UDisks2", self._bus
         )
 
-        self._lock = LoggingLock()
+        self._lock = make_lock()
         self._tasks: set[asyncio.Task] = set()
 
         self._filesystems: dict[str, dict[str, Any]] = {}
+        self._proxy_cache: dict[str, Filesystem] = {}
         self._found_drive_value: dict[str, Any] | None = None
 
-        self._led = Led("usb", logger)
+        self._led = led
+
+    def _filesystem_proxy(self, object_path: str) -> Filesystem:
+        proxy = self._proxy_cache.get(object_path)
+        if proxy is None:
+            proxy = Filesystem.new_proxy("org.freedesktop.UDisks2", object_path, self._bus)
+            self._proxy_cache[object_path] = proxy
+        return proxy
 
     async def _listen_interfaces_added(self):
         async for (
             object_path,
             interfaces_and_properties,
         ) in self._object_manager.interfaces_added:
-            async with self._lock:
-                _, iface, properties = parse_interfaces_added(
-                    object_path, interfaces_and_properties
-                )
-                if iface is not None:
-                    self._populate_known_objects(object_path, iface, properties)
+            _, iface, properties = parse_interfaces_added(object_path, interfaces_and_properties)
+            if iface is not None:
+                self._populate_known_objects(object_path, iface, properties)
 
     async def _listen_interfaces_removed(self):
         async for (
@@ -92,21 +110,48 @@ class Udisks2Manager(AbstractAsyncContextManager):
             if not iface:
                 continue
 
-            async with self._lock:
-                if (
-                    isinstance(self._found_drive, DbusInterfaceBaseAsync)
-                    and self._found_drive._dbus.object_path == object_path
-                ):
-                    self._found_drive = None
-                elif issubclass(iface, Filesystem):
-                    self._filesystems.pop(object_path, None)
+            if (
+                isinstance(self._found_drive, DbusInterfaceBaseAsync)
+                and self._found_drive._dbus.object_path == object_path
+            ):
+                self._found_drive = None
+            elif issubclass(iface, Filesystem):
+                self._filesystems.pop(object_path, None)
+                self._proxy_cache.pop(object_path, None)
 
     async def _get_managed_objects(self):
-        async with self._lock:
-            objs = parse_get_managed_objects(await self._object_manager.get_managed_objects())
-            for object_path, (iface, props) in objs.items():
-                if iface is not None:
-                    self._populate_known_objects(object_path, iface, props)
+        managed_objects = await self._object_manager.get_managed_objects()
+        # Look the drive up on the raw reply so that only it and its partitions get parsed
+        drive_path = next(
+            (
+                path
+                for path, interfaces in managed_objects.items()
+                if BLOCK_IFACE in interfaces
+                and self._match_disk(interfaces[BLOCK_IFACE].get("Symlinks", ("aay", ()))[1])
+            ),
+            None,
+        )
+        if drive_path is None:
+            return
+
+        partition_table = managed_objects[drive_path].get(PARTITION_TABLE_IFACE, {})
+        partitions = partition_table.get("Partitions", ("ao", ()))[1]
+        objs = parse_get_managed_objects(
+            {
+                path: managed_objects[path]
+                for path in (drive_path, *partitions)
+                if path in managed_objects
+            }
+        )
+
+        iface, props = objs[drive_path]
+        self._populate_known_objects(drive_path, iface, props)
+        if self._found_drive is None:
+            return
+        for object_path in partitions:
+            iface, props = objs.get(object_path, (None, None))
+            if iface is Filesystem:
+                self._populate_known_objects(object_path, iface, props)
 
     def _populate_known_objects(
         self,
@@ -114,12 +159,13 @@ class Udisks2Manager(AbstractAsyncContextManager):
         iface: DbusInterfaceBaseAsync,
         properties: dict[str, Any],
     ):
-        found_drive = self._match_disk(properties)
+        # Only one drive can sit in the front USB port: no need to match once it's known
+        found_drive = self._found_drive is None and self._match_disk(properties.get("symlinks", ()))
 
         if not found_drive and iface is not Filesystem:
             return
 
-        dev_path = properties["device"].decode().removesuffix("\x00")
+        dev_path = cstr(properties["device"])
         properties["_object_path"] = object_path
         if found_drive:
             if iface is not PartitionBlock:
@@ -136,9 +182,8 @@ class Udisks2Manager(AbstractAsyncContextManager):
             self._filesystems[object_path] = properties
             logger.debug(f"Found filesystem {dev_path}")
 
-    def _match_disk(self, properties: dict[str, Any]):
-        symlinks = {it.decode().removesuffix("\x00") for it in properties.get("symlinks", [])}
-        return WELL_KNOWN_DEV in symlinks
+    def _match_disk(self, symlinks: list[bytes]):
+        return _WELL_KNOWN_DEV_BYTES in symlinks or _WELL_KNOWN_DEV_BYTES_NO_NUL in symlinks
 
     def _done_callback(self, task: asyncio.Task):
         self._tasks.discard(task)
@@ -147,24 +192,30 @@ class Udisks2Manager(AbstractAsyncContextManager):
         elif e := task.exception():
             logger.error(e)
 
+    def _create_task(self, coro, name: str):
+        t = asyncio.create_task(coro, name=name)
+        t.add_done_callback(self._done_callback)
+        self._tasks.add(t)
+
     async def __aenter__(self):
         self._led.off()
         await self._get_managed_objects()
-        for name, coro in {
-            "interfaces added": self._listen_interfaces_added(),
-            "interfaces removed": self._listen_interfaces_removed(),
-        }.items():
-            t = asyncio.get_event_loop().create_task(coro, name=name)
-            t.add_done_callback(self._done_callback)
-            self._tasks.add(t)
-        return await super().__aenter__()
+        self._create_task(self._listen_interfaces_added(), "interfaces added")
+        self._create_task(self._listen_interfaces_removed(), "interfaces removed")
+        return self
 
     async def __aexit__(self, exc_type, exc_value, traceback, /):
         self._found_drive = None
         for task in self._tasks:
             task.cancel()
-        await asyncio.gather(*self._tasks, return_exceptions=True)
-        return await super().__aexit__(exc_type, exc_value, traceback)
+        # Don't let a stuck listener eat systemd's whole stop timeout
+        try:
+            async with asyncio.timeout(LISTENERS_STOP_TIMEOUT):
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+        except TimeoutError:
+            logger.warning("Timed out waiting for udisks listeners to stop")
+        self._bus.close()
+        return None
 
 
 class FilesystemUnmountableError(Exception):
@@ -182,51 +233,183 @@ class CopyDestUnwritableError(Exception):
 class CopyTask:
     @property
     def _log_message(self):
-        return f"{' of %s' % self.src if self.src else ''} to {self.dest}"
+        return f"{' of %s' % ', '.join(self.sources) if self.sources else ''} to {self.dest}"
 
-    def __init__(self, filesystem: Filesystem, dest: str):
-        self.src = None
+    def __init__(self, filesystems: list[Filesystem], dest: str, led: Led):
+        self.sources: list[str] = []
         self.dest = dest
 
-        self._filesystem = filesystem
+        self._filesystems = filesystems
+        self._mounted: list[Filesystem] = []
         self._progress_value = 0
-        self._already_mounted = False
-        self._percent_regex = re.compile(r"(?P<progress>\d+)%")
-        self._trailing_slash_regex = re.compile(r"/*$")
+        self._copied = 0
+        self._total = 0
+        self._next_progress = 0
+        self._stop = threading.Event()
         self._task: None | asyncio.Task = None
 
-        self._led = Led("usb", logger)
+        self._led = led
 
-    async def _mount(self) -> str:
+    async def _mount(self, filesystem: Filesystem) -> str:
         # Step 1: try mount endpoint
-        mount_point = await self._filesystem.mount_point
-        if mount_point:
-            self._already_mounted = True
-        else:
-            mount_point = await self._filesystem.mount({"auth.no_user_interaction": ("b", True)})
+        mount_point = await filesystem.mount_point
+        if not mount_point:
+            mount_point = await filesystem.mount({"auth.no_user_interaction": ("b", True)})
             if not mount_point:
-                raise FilesystemUnmountableError(await self._filesystem.device)
+                raise FilesystemUnmountableError(await filesystem.device)
+            self._mounted.append(filesystem)
 
         return mount_point
 
-    def _parse_line(self, line: str):
-        match = self._percent_regex.search(line)
-        if not match:
+    async def _unmount(self, filesystem: Filesystem):
+        dev = cstr(await filesystem.device)
+        try:
+            await filesystem.unmount({"auth.no_user_interaction": ("b", True)})
+            logger.log(LogLevels.SERVICE_LIFECYCLE, f"Unmounted {dev}")
+        except DeviceBusyError:
+            logger.warning(f"Can't auto-unmount {dev}: device is busy")
+
+    def _open_src(self, path: str) -> int:
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_NOATIME)
+        except PermissionError:
+            # O_NOATIME is only allowed for the file's owner or a privileged process
+            fd = os.open(path, os.O_RDONLY)
+        # Larger readahead keeps the USB drive busy while the previous chunk is being written.
+        # It's only a hint: a failure must neither abort the copy nor leak the descriptor
+        with suppress(OSError):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return fd
+
+    def _advance(self, copied: int):
+        self._copied += copied
+        # Only do the percentage computation once the next percent is actually reached
+        if self._copied < self._next_progress:
             return
-        value = int(match.group("progress"))
+        value = min(self._copied * 100 // self._total, 100) if self._total else 100
+        self._next_progress = -(-(value + 1) * self._total // 100)
         if value > self._progress_value:
             self._progress_value = value
             logger.info(f"Copy progress: {value}%")
 
-    async def _process_stdout(self, process):
+    def _make_dir(self, path: str, uid: int, gid: int):
         try:
-            while line := await process.stdout.readuntil(b"\r"):
-                self._parse_line(line.decode())
-        except asyncio.IncompleteReadError as e:
-            self._parse_line(e.partial.decode())
+            os.mkdir(path)
+        except FileExistsError:
+            # Already created by a previous copy: a single failed mkdir, no stat nor chown
+            return
+        if uid != -1 or gid != -1:
+            os.chown(path, uid, gid)
 
-    async def _copy_process(self, src: str, dest: str):
-        additionnal_args = []
+    def _scan(
+        self,
+        src: str,
+        dest: str,
+        uid: int,
+        gid: int,
+        files: list[tuple[str, str, int, int]],
+    ):
+        try:
+            with os.scandir(src) as it:
+                for entry in it:
+                    # Walking a large drive can take a while: don't hold up shutdown until it ends
+                    if self._stop.is_set():
+                        return
+                    dest_path = os.path.join(dest, entry.name)
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            self._make_dir(dest_path, uid, gid)
+                            self._scan(entry.path, dest_path, uid, gid, files)
+                        elif entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            try:
+                                # Same as rsync's --update: skip files newer on the receiver
+                                if os.stat(dest_path).st_mtime_ns >= stat.st_mtime_ns:
+                                    continue
+                            except FileNotFoundError:
+                                pass
+                            # Like rsync without -p: source permissions, masked by the umask
+                            mode = stat.st_mode & 0o777
+                            files.append((entry.path, dest_path, stat.st_size, mode))
+                        else:
+                            logger.debug(f"Skipping non-regular file {entry.path}")
+                    except OSError as e:
+                        # Like rsync, report the entry and carry on with the rest of the tree
+                        logger.error(f"Skipping {entry.path}: {e}")
+        except OSError as e:
+            logger.error(f"Unable to read directory {src}: {e}")
+
+    def _copy_fd(self, src_fd: int, dest_fd: int) -> bool:
+        use_copy_file_range = True
+        while not self._stop.is_set():
+            if use_copy_file_range:
+                try:
+                    copied = os.copy_file_range(src_fd, dest_fd, COPY_CHUNK_SIZE)
+                except OSError as e:
+                    if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                        raise
+                    use_copy_file_range = False
+                    continue
+            else:
+                copied = os.sendfile(dest_fd, src_fd, None, COPY_CHUNK_SIZE)
+            if not copied:
+                return True
+            self._advance(copied)
+        return False
+
+    def _open_tmp(self, dest_path: str, mode: int) -> tuple[str, int]:
+        head, name = dest_path.rsplit("/", 1)
+        # Same as rsync: a unique ".name.XXXXXX" sibling, the name shortened so that it still fits
+        stem = os.fsdecode(os.fsencode(name)[:_TMP_NAME_MAX])
+        while True:
+            tmp_path = f"{head}/.{stem}.{secrets.token_hex(3)}"
+            try:
+                return tmp_path, os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+            except FileExistsError:
+                continue
+
+    def _copy_file(self, src_path: str, dest_path: str, mode: int, uid: int, gid: int):
+        # Like rsync, write to a temporary file only renamed once complete: an interrupted or
+        # failed copy never leaves a partial file behind that --update semantics would then skip
+        tmp_path = None
+        src_fd = self._open_src(src_path)
+        try:
+            tmp_path, dest_fd = self._open_tmp(dest_path, mode)
+            try:
+                if uid != -1 or gid != -1:
+                    os.fchown(dest_fd, uid, gid)
+                complete = self._copy_fd(src_fd, dest_fd)
+            finally:
+                os.close(dest_fd)
+            if complete:
+                os.rename(tmp_path, dest_path)
+                tmp_path = None
+        finally:
+            os.close(src_fd)
+            if tmp_path:
+                with suppress(OSError):
+                    os.unlink(tmp_path)
+
+    def _copy_tree(self, sources: list[tuple[str, str]], uid: int, gid: int):
+        files: list[tuple[str, str, int, int]] = []
+        for src, dest in sources:
+            try:
+                self._make_dir(dest, uid, gid)
+            except OSError as e:
+                raise CopyDestUnwritableError(dest) from e
+            self._scan(src, dest, uid, gid, files)
+        self._total = sum(size for _, _, size, _ in files)
+        self._next_progress = -(-self._total // 100)
+
+        for src_path, dest_path, _, mode in files:
+            if self._stop.is_set():
+                return
+            try:
+                self._copy_file(src_path, dest_path, mode, uid, gid)
+            except OSError as e:
+                logger.error(f"Unable to copy {src_path}: {e}")
+
+    async def _copy_process(self, sources: list[str], dest: str):
         owner = EnvVars.OWNER.env
         group = EnvVars.GROUP.env
 
@@ -236,45 +419,55 @@ class CopyTask:
                 f"configuration will be ignored"
             )
 
+        uid = gid = -1
         if owner:
-            additionnal_args.append(f"--chown={owner}:{group if group else ''}")
-
-        # Removing trailing slashed will create the additionnal directory on dest
-        src = self._trailing_slash_regex.sub("", src)
-        dest = self._trailing_slash_regex.sub("", dest)
-        async with asyncio.TaskGroup() as group:
-            args = shlex.join(
-                [
-                    *additionnal_args,
-                    "--compress",
-                    "--recursive",
-                    "--update",
-                    "--info=progress2",
-                    src,
-                    dest,
-                ]
-            )
-            logger.debug(f"Running 'rsync {args}")
-            copy_task = await asyncio.create_subprocess_exec(
-                "rsync",
-                *shlex.split(args),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            group.create_task(copy_task.wait())
-            group.create_task(self._process_stdout(copy_task))
+            uid = int(owner) if owner.isdigit() else pwd.getpwnam(owner).pw_uid
+            if group:
+                gid = int(group) if group.isdigit() else grp.getgrnam(group).gr_gid
+
+        # Like rsync without trailing slash on src, copy into an additionnal directory on dest
+        dest = dest.rstrip("/")
+        pairs = [(src, f"{dest}/{src.rsplit('/', 1)[-1]}") for src in sources]
+        logger.debug(f"Copying {', '.join(sources)} to {dest}")
+
+        # All sources are copied sequentially by a single job so that the USB drive and the
+        # destination disk aren't hit by concurrent streams and progress covers the whole copy
+        copy = asyncio.ensure_future(asyncio.to_thread(self._copy_tree, pairs, uid, gid))
+        try:
             # Create artificial delay so that the LED blinks to indicate at least something happned
-            group.create_task(asyncio.sleep(1))
+            await asyncio.gather(asyncio.shield(copy), asyncio.sleep(1))
+        except asyncio.CancelledError:
+            # The copy thread can't be interrupted: ask it to stop and wait for it to release files
+            self._stop.set()
+            await copy
+            raise
 
     async def run(self) -> Exception | None:
         try:
-            self.src = self._trailing_slash_regex.sub("", await self._mount())
+            # Query/mount every partition concurrently rather than one UDisks2 round-trip at a time
+            mount_points = await asyncio.gather(
+                *(self._mount(it) for it in self._filesystems), return_exceptions=True
+            )
+            for mount_point in mount_points:
+                if isinstance(mount_point, FilesystemUnmountableError):
+                    logger.error(f"{mount_point}")
+                elif isinstance(mount_point, Exception):
+                    # Extended, swap or encrypted partitions have no filesystem to mount: skip them
+                    logger.error(f"Skipping partition that can't be mounted: {mount_point}")
+                elif isinstance(mount_point, BaseException):
+                    raise mount_point
+                else:
+                    self.sources.append(mount_point.rstrip("/"))
+            if not self.sources:
+                return
+
             logger.log(LogLevels.SERVICE_LIFECYCLE, f"Starting copy{self._log_message}")
             self._led.blink()
-            await self._copy_process(self.src, self.dest)
+            await self._copy_process(self.sources, self.dest)
             logger.log(LogLevels.SERVICE_LIFECYCLE, f"Finished copy{self._log_message}")
         except asyncio.CancelledError:
             logger.info(f"Copy{self._log_message} cancelled")
+            raise
         except (CopyDestUnwritableError, FilesystemUnmountableError) as e:
             logger.error(f"{e}")
         except Exception as e:
@@ -284,27 +477,22 @@ class CopyTask:
             )
         finally:
             self._led.on()
-            if not self._already_mounted:
-                dev = (await self._filesystem.device).decode().removesuffix("\x00")
-                try:
-                    await self._filesystem.unmount({"auth.no_user_interaction": ("b", True)})
-                    logger.log(LogLevels.SERVICE_LIFECYCLE, f"Unmounted {dev}")
-                except DeviceBusyError:
-                    logger.warning(f"Can't auto-unmount {dev}: device is busy")
+            for filesystem in self._mounted:
+                await self._unmount(filesystem)
 
 
 class Service(AbstractAsyncContextManager):
-    def __init__(self, device: InputDevice, manager: Udisks2Manager, dest: Path):
+    def __init__(self, device: InputDevice, manager: Udisks2Manager, dest: Path, led: Led):
         self._device = device
         self._manager = manager
         self._dest = dest.resolve()
+        self._led = led
 
-        self._copy_task: asyncio.Task | None = None
-        self._listen_task: asyncio.Task | None = None
-        self._lock = asyncio.Lock()
-
-    def _copy_task_done(self, _):
-        self._copy_task = None
+        # A single USB mass-storage device is saturated by one reader: copies are serialized
+        # and button presses are ignored while every worker is busy
+        self._copy_queue: asyncio.Queue[None] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        self._busy_workers = 0
 
     async def _run_copy(self):
         filesystems = await self._manager.filesystems
@@ -312,41 +500,55 @@ class Service(AbstractAsyncContextManager):
             logger.info("No filesystem found")
             return
 
-        async with asyncio.TaskGroup() as group:
-            for filesystem in filesystems:
-                group.create_task(CopyTask(filesystem, f"{self._dest}").run())
-
-    async def _listen_button_evts(self):
-        async for event in self._device.async_read_loop():
-            if (
-                event.type != ecodes.EV_KEY
-                or event.code != ecodes.BTN_2
-                or event.value != KeyEvent.key_up
-            ):
-                continue
+        await CopyTask(filesystems, f"{self._dest}", self._led).run()
+
+    async def _copy_worker(self):
+        while True:
+            await self._copy_queue.get()
+            self._busy_workers += 1
+            try:
+                await self._run_copy()
+            except Exception as e:
+                logger.error("An unexpected error happened during copy", exc_info=e)
+            finally:
+                self._busy_workers -= 1
+                self._copy_queue.task_done()
+
+    def _on_evdev_ready(self):
+        ev_key, btn_2, key_up = ecodes.EV_KEY, ecodes.BTN_2, KeyEvent.key_up
+        try:
+            # Drain every pending event at once instead of waking up for each of them
+            for event in self._device.read():
+                if event.type != ev_key or event.code != btn_2 or event.value != key_up:
+                    continue
 
-            async with self._lock:
-                if self._copy_task:
+                if self._busy_workers + self._copy_queue.qsize() >= COPY_WORKERS:
                     logger.warning("Copy process already encours; ignoring input…")
                     continue
-
-                self._copy_task = asyncio.get_event_loop().create_task(self._run_copy())
-                self._copy_task.add_done_callback(self._copy_task_done)
+                self._copy_queue.put_nowait(None)
+        except BlockingIOError:
+            pass
+        except OSError as e:
+            # The input device is gone (e.g. its driver was unloaded): stop polling it
+            logger.error(f"Stopped listening to {self._device.path}: {e}")
+            asyncio.get_running_loop().remove_reader(self._device.fd)
 
     async def __aenter__(self):
-        loop = asyncio.get_event_loop()
-        self._listen_task = loop.create_task(self._listen_button_evts())
+        self._workers = [
+            asyncio.create_task(self._copy_worker(), name=f"copy worker {i}")
+            for i in range(COPY_WORKERS)
+        ]
+        asyncio.get_running_loop().add_reader(self._device.fd, self._on_evdev_ready)
         logger.log(LogLevels.SERVICE_LIFECYCLE, "Service started")
-        return await super().__aenter__()
+        return self
 
     async def __aexit__(self, exc_type, exc_value, traceback, /):
-        tasks = []
-        if self._listen_task:
-            self._listen_task.cancel()
-            tasks.append(self._listen_task)
+        asyncio.get_running_loop().remove_reader(self._device.fd)
 
-        if self._copy_task:
-            self._copy_task.cancel()
-            tasks.append(self._copy_task)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
 
-        await asyncio.gather(*tasks, return_exceptions=True)
+        while not self._copy_queue.empty():
+            self._copy_queue.get_nowait()
+            self._copy_queue.task_done()
@@ -12,6 +12,11 @@ from sdbus import (
 )
 
 
+# UDisks2 sends paths as NUL-terminated byte arrays
+def cstr(value: bytes) -> str:
+    return value.rstrip(b"\x00").decode()
+
+
 class Manager(DbusInterfaceCommonAsync, interface_name="org.freedesktop.UDisks2.Manager"):
     @dbus_method_async(
         input_signature="s",
@@ -305,8 +310,8 @@ class FilesystemMixin(
 
     @property
     async def mount_point(self) -> str | None:
-        mnt_pnts = [it.decode().removesuffix("\x00") for it in await self.mount_points]
-        return mnt_pnts[0] if mnt_pnts else None
+        mnt_pnts = await self.mount_points
+        return cstr(mnt_pnts[0]) if mnt_pnts else None
 
 
 class Block(DbusInterfaceCommonAsync, interface_name="org.freedesktop.UDisks2.Block"):
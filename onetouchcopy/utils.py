@@ -7,7 +7,6 @@ import sys
 
 from sdbus.utils import (
     parse_interfaces_added as sdbus_parse_interfaces_added,
-    parse_interfaces_removed as sdbus_parse_interfaces_removed,
     parse_get_managed_objects as sdbus_parse_get_managed_objects,
 )
 
@@ -22,6 +21,13 @@ FILESYSTEM_IFACE = "org.freedesktop.UDisks2.Filesystem"
 PARTITION_TABLE_IFACE = "org.freedesktop.UDisks2.PartitionTable"
 BLOCK_IFACE = "org.freedesktop.UDisks2.Block"
 INTERFACES = (Filesystem, Block, PartitionBlock)
+_KNOWN_IFACES = frozenset((PARTITION_TABLE_IFACE, FILESYSTEM_IFACE, BLOCK_IFACE))
+# Same priority as sdbus' use_interface_subsets matching: largest interface sets first
+_IFACES_TO_CLASS = (
+    (frozenset((BLOCK_IFACE, FILESYSTEM_IFACE)), Filesystem),
+    (frozenset((BLOCK_IFACE, PARTITION_TABLE_IFACE)), PartitionBlock),
+    (frozenset((BLOCK_IFACE,)), Block),
+)
 
 
 logger = logging.getLogger("One touch copy daemon")
@@ -42,7 +48,7 @@ class EnvVars(enum.StrEnum):
 
     @enum_property
     def env(self):
-        return os.getenv(f"{self.value}", None)
+        return os.environ.get(self.value)
 
 
 class LoggingLock(asyncio.Lock):
@@ -62,36 +68,72 @@ class LoggingLock(asyncio.Lock):
         super().release()
 
 
+def make_lock() -> asyncio.Lock:
+    # Only pay for LoggingLock's overrides when debug logs are actually emitted; must be
+    # called once logging is configured
+    return LoggingLock() if logger.isEnabledFor(logging.DEBUG) else asyncio.Lock()
+
+
 class Led:
+    _FILES = ("trigger", "brightness", "delay_on", "delay_off")
+    _ON = (("trigger", b"none"), ("brightness", b"1"))
+    _OFF = (("trigger", b"none"), ("brightness", b"0"))
+    _BLINK = (
+        ("trigger", b"timer"),
+        ("brightness", b"1"),
+        ("delay_on", b"200"),
+        ("delay_off", b"200"),
+    )
+
     def __init__(self, name: str, logger: logging.Logger):
         self._name = name
         self._logger = logger
+        self._paths = {it: f"/sys/class/leds/qnap8528::{name}/{it}" for it in self._FILES}
+        self._fds: dict[str, int] = {}
 
     def on(self):
-        self._write("trigger", "none")
-        self._write("brightness", "1")
+        self._batch_write(self._ON)
 
     def off(self):
-        self._write("trigger", "none")
-        self._write("brightness", "0")
+        self._batch_write(self._OFF)
 
     def blink(self):
-        self._write("trigger", "timer")
-        self._write("brightness", "1")
-        self._write("delay_on", "200")
-        self._write("delay_off", "200")
-
-    def _write(self, filename: str, content: str):
-        file = f"/sys/class/leds/qnap8528::{self._name}/{filename}"
-        try:
-            with open(file, "w") as f:
-                f.write(content)
-                self._logger.debug(f"Written {content} to {file}")
-        except OSError:
-            self._logger.debug(f"Can't write to {file}")
+        self._batch_write(self._BLINK)
+
+    def close(self):
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds.clear()
+
+    def __del__(self):
+        self.close()
+
+    def _fd(self, filename: str) -> int:
+        fd = self._fds.get(filename)
+        if fd is None:
+            fd = self._fds[filename] = os.open(self._paths[filename], os.O_WRONLY)
+        return fd
+
+    def _batch_write(self, writes: tuple[tuple[str, bytes], ...]):
+        for filename, content in writes:
+            file = self._paths[filename]
+            try:
+                try:
+                    os.pwrite(self._fd(filename), content, 0)
+                except OSError:
+                    # Trigger attributes (delay_on, …) are recreated each time the trigger changes
+                    if (fd := self._fds.pop(filename, None)) is not None:
+                        os.close(fd)
+                    os.pwrite(self._fd(filename), content, 0)
+                self._logger.debug(f"Written {content.decode()} to {file}")
+            except OSError:
+                self._logger.debug(f"Can't write to {file}")
 
 
 def parse_interfaces_added(path, interfaces_added_data):
+    # Drives, jobs, etc. can't match any of INTERFACES: skip sdbus' class resolution for them
+    if _KNOWN_IFACES.isdisjoint(interfaces_added_data):
+        return path, None, {}
     return sdbus_parse_interfaces_added(
         INTERFACES,
         (path, interfaces_added_data),
@@ -101,10 +143,18 @@ def parse_interfaces_added(path, interfaces_added_data):
     )
 
 
+def _get_class_from_interfaces(interface_names):
+    hits = _KNOWN_IFACES.intersection(interface_names)
+    if hits:
+        for interfaces, cls in _IFACES_TO_CLASS:
+            if interfaces <= hits:
+                return cls
+    return None
+
+
 def parse_interfaces_removed(path, interfaces_removed_data):
-    return sdbus_parse_interfaces_removed(
-        INTERFACES, (path, interfaces_removed_data), "none", use_interface_subsets=True
-    )
+    # Only the class is needed: resolve it without sdbus rebuilding its interfaces map per call
+    return path, _get_class_from_interfaces(interfaces_removed_data)
 
 
 def parse_get_managed_objects(managed_objects_data):
@@ -113,13 +163,14 @@ def parse_get_managed_objects(managed_objects_data):
     )
 
 
-async def await_sig():
-    def handler(signum):
-        if not future.done():
-            future.set_result(signum)
+def _set_result_once(future: asyncio.Future, result):
+    if not future.done():
+        future.set_result(result)
+
 
-    loop = asyncio.get_event_loop()
+async def await_sig():
+    loop = asyncio.get_running_loop()
     future = loop.create_future()
-    loop.add_signal_handler(signal.SIGINT, handler, signal.SIGINT)
-    loop.add_signal_handler(signal.SIGTERM, handler, signal.SIGTERM)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, _set_result_once, future, signum)
     await future